@@ -0,0 +1,26 @@
+"""enable pgcrypto for server-side address hashing
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-08-31 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '002'
+down_revision: Union[str, None] = '001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # digest() is used to compute addresses.normalized_hash inside INSERT
+    # statements (see scripts/seed_data.py)
+    op.execute('CREATE EXTENSION IF NOT EXISTS "pgcrypto"')
+
+
+def downgrade() -> None:
+    op.execute('DROP EXTENSION IF EXISTS "pgcrypto"')
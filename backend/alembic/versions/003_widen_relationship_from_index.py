@@ -0,0 +1,35 @@
+"""widen relationship from-index with to_type
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-08-31 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '003'
+down_revision: Union[str, None] = '002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Graph traversals filter on from_type/from_id/rel_type AND to_type
+    # (e.g. "entity X owns property"); including to_type lets those
+    # queries run as index-only scans instead of heap lookups.
+    op.drop_index('idx_relationship_from', table_name='relationships')
+    op.create_index(
+        'idx_relationship_from', 'relationships',
+        ['from_type', 'from_id', 'rel_type', 'to_type'], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_relationship_from', table_name='relationships')
+    op.create_index(
+        'idx_relationship_from', 'relationships',
+        ['from_type', 'from_id', 'rel_type'], unique=False
+    )
@@ -31,7 +31,8 @@ class Relationship(Base):
 
     # Composite indexes for efficient graph traversal
     __table_args__ = (
-        Index('idx_relationship_from', 'from_type', 'from_id', 'rel_type'),
+        # to_type included so owns/located_at traversals are index-only
+        Index('idx_relationship_from', 'from_type', 'from_id', 'rel_type', 'to_type'),
         Index('idx_relationship_to', 'to_type', 'to_id', 'rel_type'),
         Index('idx_relationship_active', 'end_date'),  # NULL end_date = active
         Index('idx_relationship_source', 'source_system', 'rel_type'),
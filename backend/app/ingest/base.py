@@ -1,6 +1,7 @@
 # Abstract base classes for ETL ingestion
 from abc import ABC, abstractmethod
 from typing import Iterable, Dict, Any, Optional, List
+import httpx
 from dataclasses import dataclass
 from enum import Enum
 from sqlalchemy.orm import Session
@@ -58,16 +59,42 @@ class NormalizedRecord(dict):
         self.record_type = record_type  # 'entity', 'property', 'relationship'
 
 
+_http_client: Optional[httpx.Client] = None
+
+
+def get_http_client() -> httpx.Client:
+    """Process-wide HTTP client shared across sources and runs.
+
+    Keep-alive connections and TLS sessions in its pool are reused
+    between scheduled ingests instead of re-handshaking per run.
+    """
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.Client(
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=8),
+        )
+    return _http_client
+
+
 class IngestSource(ABC):
     """
     Abstract base class for all data ingestion sources.
     Each concrete implementation handles one data source (e.g., Sunbiz, County Appraiser).
     """
     
-    def __init__(self, name: str, description: str):
+    def __init__(self, name: str, description: str, session: Optional[httpx.Client] = None):
         self.name = name
         self.description = description
         self.logger = get_logger(f"ingest.{name}")
+        self._session = session
+    
+    @property
+    def http(self) -> httpx.Client:
+        """HTTP client for fetch implementations (shared pool by default)."""
+        if self._session is None:
+            self._session = get_http_client()
+        return self._session
     
     @abstractmethod
     def fetch_batch(self, batch_size: int = 100, **kwargs) -> Iterable[RawRecord]:
@@ -285,7 +312,7 @@ class IngestCoordinator:
     def run_all_sources(self, **kwargs) -> Dict[str, IngestResult]:
         """Run all registered sources."""
         results = {}
-        
+
         for source_name in self.sources:
             self.logger.info(f"Running source: {source_name}")
             try:
@@ -300,7 +327,7 @@ class IngestCoordinator:
                     errors=[str(e)],
                     duration_seconds=0
                 )
-        
+
         return results
     
     def get_source_status(self) -> Dict[str, Dict[str, Any]]:
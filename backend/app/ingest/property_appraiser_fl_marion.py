@@ -16,10 +16,11 @@ class MarionCountyPropertySource(IngestSource):
     Ingests property records including ownership, valuations, and sales data.
     """
     
-    def __init__(self):
+    def __init__(self, session=None):
         super().__init__(
             name="marion_pa",
-            description="Marion County, FL Property Appraiser records"
+            description="Marion County, FL Property Appraiser records",
+            session=session
         )
     
     def fetch_batch(self, batch_size: int = 100, **kwargs) -> Iterable[RawRecord]:
@@ -15,10 +15,11 @@ class SunbizSource(IngestSource):
     Ingests entity data from Florida business registrations.
     """
     
-    def __init__(self):
+    def __init__(self, session=None):
         super().__init__(
             name="sunbiz",
-            description="Florida Division of Corporations business entity records"
+            description="Florida Division of Corporations business entity records",
+            session=session
         )
     
     def fetch_batch(self, batch_size: int = 100, **kwargs) -> Iterable[RawRecord]:
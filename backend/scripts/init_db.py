@@ -411,9 +411,7 @@ def main():
         logger.info("     - GET http://localhost:8000/api/v1/properties/1")
         
     except Exception as e:
-        logger.error(f"\n❌ ERROR: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"\n❌ ERROR: {e}")
         sys.exit(1)
     finally:
         engine.dispose()
@@ -13,21 +13,29 @@ This script creates comprehensive sample data to validate the complete data pipe
 The data is designed to trigger various risk scoring patterns.
 
 Usage:
-    python scripts/seed_sample_data.py [--clear-all] [--batch-size N]
+    python scripts/seed_sample_data.py [--clear-all] [--batch-size N] [--scale N]
 
 Options:
     --clear-all     Delete all existing data before seeding
     --batch-size    Number of records to insert per batch (default: 100)
+    --scale         Multiply the dataset with synthetic rows (default: 1,
+                    i.e. only the curated sample data)
 """
 
 import sys
 import os
 import argparse
 import logging
+import random
 from datetime import date, datetime, timedelta
+from dataclasses import dataclass
+from itertools import islice
 from decimal import Decimal
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
+import csv
 import hashlib
+import io
+import json
 
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -47,14 +55,213 @@ logger = logging.getLogger(__name__)
 
 
 def normalize_address_hash(line1: str, city: str, state: str, postal_code: str) -> str:
-    """Generate normalized hash for address deduplication."""
+    """Generate normalized hash for address deduplication.
+
+    The hash is a dedup key, not a security boundary, so BLAKE2b is used
+    over SHA-256 for throughput; digest_size=32 keeps the 64-hex-char
+    width the normalized_hash column expects.
+    """
     normalized = f"{line1.upper().strip()}|{city.upper().strip()}|{state.upper().strip()}|{postal_code[:5]}"
-    return hashlib.sha256(normalized.encode()).hexdigest()
+    return hashlib.blake2b(normalized.encode(), digest_size=32).hexdigest()
+
+
+def _days_ago(days: int, _cache: Dict[int, date] = {}) -> date:
+    """Return the date `days` before today, cached per offset.
+
+    The data literals reference the same handful of offsets repeatedly;
+    caching avoids a fresh timedelta/date allocation per row when the
+    seed is scaled up.
+    """
+    if days not in _cache:
+        _cache[days] = date.today() - timedelta(days=days)
+    return _cache[days]
+
+
+def _confidence(value: float, _cache: Dict[float, Decimal] = {}) -> Decimal:
+    """Convert a confidence float to Decimal, memoized per value.
+
+    The seed reuses a handful of confidence levels across many rows;
+    Decimal(str(...)) construction is surprisingly costly, so each
+    distinct value is converted once.
+    """
+    if value not in _cache:
+        _cache[value] = Decimal(str(value))
+    return _cache[value]
+
+
+# Translation table built once; str.translate drops both punctuation
+# characters in a single C-level pass instead of two replace() calls.
+_NAME_PUNCT = str.maketrans('', '', ',.')
 
 
 def normalize_name(name: str) -> str:
     """Normalize person name for matching."""
-    return name.upper().replace(',', '').replace('.', '').strip()
+    return name.upper().translate(_NAME_PUNCT).strip()
+
+
+# Row types for the seed literals: frozen slots dataclasses cost a
+# fraction of a dict per row and make the column set explicit. They are
+# projected into column-named mapping dicts only at insert time.
+@dataclass(slots=True, frozen=True)
+class EntityRow:
+    external_id: str
+    source_system: str
+    type: str
+    legal_name: str
+    jurisdiction: str
+    status: str
+    formation_date: date
+    ein_available: bool
+    ein_verified: bool
+    agent: Tuple[str, str]
+    address: str
+
+
+@dataclass(slots=True, frozen=True)
+class PropertyRow:
+    parcel_id: str
+    county: str
+    jurisdiction: str
+    address: str
+    land_use_code: str
+    acreage: Decimal
+    last_sale_date: Optional[date]
+    last_sale_price: Optional[Decimal]
+    market_value: Decimal
+    assessed_value: Decimal
+    homestead_exempt: str
+    tax_year: str
+
+
+@dataclass(slots=True, frozen=True)
+class RelationshipRow:
+    from_type: str
+    from_ref: str
+    to_type: str
+    to_ref: Any
+    rel_type: str
+    source: str
+    confidence: float
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+
+
+# Seed fixture literals live at module scope so they are built once at
+# import, are inspectable without running the script, and the creator
+# functions only do id resolution and inserts.
+_RELATIONSHIPS = [
+    # Entity -> Officer relationships
+    RelationshipRow("entity", "L23001234", "person", ("officer", "Robert Davis"), "officer", "sunbiz", 1.0),
+    RelationshipRow("entity", "L22005678", "person", ("officer", "Jennifer Wilson"), "officer", "sunbiz", 1.0),
+    RelationshipRow("entity", "C21001111", "person", ("officer", "David Martinez"), "officer", "sunbiz", 1.0),
+    RelationshipRow("entity", "C19002222", "person", ("officer", "Maria Garcia"), "officer", "sunbiz", 1.0),
+    
+    # Entity -> Owns -> Property (HIGH PROPERTY VOLUME for Triple Crown)
+    RelationshipRow("entity", "L20009999", "property", "10234-001-000", "owns", "marion_pa", 0.95, start_date=_days_ago(500)),
+    RelationshipRow("entity", "L20009999", "property", "40123-300-000", "owns", "marion_pa", 0.95, start_date=_days_ago(600)),
+    RelationshipRow("entity", "L20009999", "property", "40123-301-000", "owns", "marion_pa", 0.95, start_date=_days_ago(700)),
+    RelationshipRow("entity", "L20009999", "property", "40123-302-000", "owns", "marion_pa", 0.95, start_date=_days_ago(650)),
+    
+    # Other entity property ownership
+    RelationshipRow("entity", "L22005678", "property", "10234-002-000", "owns", "marion_pa", 0.90, start_date=_days_ago(1200)),
+    RelationshipRow("entity", "L23001234", "property", "10234-003-000", "owns", "marion_pa", 0.92, start_date=_days_ago(90)),
+    RelationshipRow("entity", "C19002222", "property", "20456-100-000", "owns", "marion_pa", 0.88, start_date=_days_ago(800)),
+    RelationshipRow("entity", "T20003333", "property", "20456-101-000", "owns", "marion_pa", 1.0),
+    RelationshipRow("entity", "C21001111", "property", "30789-200-000", "owns", "marion_pa", 0.93, start_date=_days_ago(300)),
+    RelationshipRow("entity", "N18004444", "property", "30789-201-000", "owns", "marion_pa", 0.85, start_date=_days_ago(1500)),
+
+]
+
+_EVENTS = [
+    # Formation events for all entities
+    {"entity": "L23001234", "type": "FORMATION", "date": _days_ago(45), "source": "sunbiz", "payload": {"filing_type": "Articles of Organization", "filing_number": "L23001234"}},
+    {"entity": "L22005678", "type": "FORMATION", "date": _days_ago(365), "source": "sunbiz", "payload": {"filing_type": "Articles of Organization", "filing_number": "L22005678"}},
+    {"entity": "L20009999", "type": "FORMATION", "date": _days_ago(900), "source": "sunbiz", "payload": {"filing_type": "Articles of Organization", "filing_number": "L20009999"}},
+    {"entity": "C21001111", "type": "FORMATION", "date": _days_ago(1200), "source": "sunbiz", "payload": {"filing_type": "Articles of Incorporation", "filing_number": "C21001111", "state_of_incorporation": "Delaware"}},
+    {"entity": "C19002222", "type": "FORMATION", "date": _days_ago(1800), "source": "sunbiz", "payload": {"filing_type": "Articles of Incorporation", "filing_number": "C19002222", "state_of_incorporation": "Texas"}},
+    {"entity": "T20003333", "type": "FORMATION", "date": _days_ago(2500), "source": "marion_pa", "payload": {"trust_type": "Revocable Living Trust", "trustee": "Thomas Anderson"}},
+    {"entity": "N18004444", "type": "FORMATION", "date": _days_ago(2000), "source": "sunbiz", "payload": {"filing_type": "Articles of Incorporation - Nonprofit", "filing_number": "N18004444"}},
+    {"entity": "L21005555", "type": "FORMATION", "date": _days_ago(600), "source": "sunbiz", "payload": {"filing_type": "Articles of Organization", "filing_number": "L21005555"}},
+    {"entity": "L20006666", "type": "FORMATION", "date": _days_ago(1100), "source": "sunbiz", "payload": {"filing_type": "Articles of Organization", "filing_number": "L20006666"}},
+    {"entity": "L22007777", "type": "FORMATION", "date": _days_ago(200), "source": "sunbiz", "payload": {"filing_type": "Articles of Organization", "filing_number": "L22007777"}},
+    
+    # Officer change events
+    {"entity": "L23001234", "type": "OFFICER_CHANGE", "date": _days_ago(30), "source": "sunbiz", "payload": {"change_type": "Manager Appointed", "officer_name": "Robert Davis", "title": "Manager"}},
+    {"entity": "C21001111", "type": "OFFICER_CHANGE", "date": _days_ago(180), "source": "sunbiz", "payload": {"change_type": "Director Change", "officer_name": "David Martinez", "title": "Director"}},
+    
+    # Address change events
+    {"entity": "L22005678", "type": "ADDRESS_CHANGE", "date": _days_ago(120), "source": "sunbiz", "payload": {"old_address": "555 Old Street, Ocala, FL 34470", "new_address": "456 Commerce Blvd, Ocala, FL 34471"}},
+    
+    # Deed transfer events (property sales)
+    {"entity": "L20009999", "type": "DEED_TRANSFER", "date": _days_ago(500), "source": "marion_pa", "payload": {"parcel_id": "10234-001-000", "transfer_type": "Warranty Deed", "consideration": "285000"}},
+    {"entity": "L20009999", "type": "DEED_TRANSFER", "date": _days_ago(600), "source": "marion_pa", "payload": {"parcel_id": "40123-300-000", "transfer_type": "Warranty Deed", "consideration": "175000"}},
+    {"entity": "L20009999", "type": "DEED_TRANSFER", "date": _days_ago(700), "source": "marion_pa", "payload": {"parcel_id": "40123-301-000", "transfer_type": "Warranty Deed", "consideration": "165000"}},
+    {"entity": "L20009999", "type": "DEED_TRANSFER", "date": _days_ago(650), "source": "marion_pa", "payload": {"parcel_id": "40123-302-000", "transfer_type": "Warranty Deed", "consideration": "185000"}},
+    {"entity": "L23001234", "type": "DEED_TRANSFER", "date": _days_ago(90), "source": "marion_pa", "payload": {"parcel_id": "10234-003-000", "transfer_type": "Warranty Deed", "consideration": "320000"}},
+    {"entity": "C19002222", "type": "DEED_TRANSFER", "date": _days_ago(800), "source": "marion_pa", "payload": {"parcel_id": "20456-100-000", "transfer_type": "Warranty Deed", "consideration": "450000"}},
+    
+    # Annual report events
+    {"entity": "L22005678", "type": "ANNUAL_REPORT", "date": _days_ago(50), "source": "sunbiz", "payload": {"report_year": "2024", "status": "Filed"}},
+    {"entity": "L20009999", "type": "ANNUAL_REPORT", "date": _days_ago(60), "source": "sunbiz", "payload": {"report_year": "2024", "status": "Filed"}},
+    
+    # Status change event (dissolution)
+    {"entity": "L20006666", "type": "STATUS_CHANGE", "date": _days_ago(100), "source": "sunbiz", "payload": {"old_status": "ACTIVE", "new_status": "DISSOLVED", "reason": "Administrative Dissolution"}},
+]
+
+
+def _insert_chunked(db, stmt, mappings, chunk_size: int = 1000) -> list:
+    """Execute an insert statement in fixed-size chunks of mappings.
+
+    Bounds memory at chunk_size rows per statement and stays clear of
+    Postgres's ~65535-parameter limit when the seed is scaled up. Rows
+    produced by a RETURNING clause are collected across chunks.
+    """
+    returned = []
+    it = iter(mappings)
+    while chunk := list(islice(it, chunk_size)):
+        result = db.execute(stmt, chunk)
+        if result.returns_rows:
+            returned.extend(result)
+    return returned
+
+
+def _copy_rows(db, table: str, columns: List[str], rows: List[tuple]) -> None:
+    """Stream rows into a table with COPY FROM STDIN (PostgreSQL only).
+
+    COPY bypasses per-row parse/plan work entirely; None values become
+    unquoted empty fields, which CSV-mode COPY reads as NULL.
+    """
+    buf = io.StringIO()
+    csv.writer(buf).writerows(rows)
+    buf.seek(0)
+    cursor = db.connection().connection.cursor()
+    cursor.copy_expert(
+        f"COPY {table} ({', '.join(columns)}) FROM STDIN CSV", buf
+    )
+
+
+def _drop_relationship_indexes(db) -> List[str]:
+    """Drop the non-unique indexes on relationships, returning their DDL.
+
+    Classic bulk-load recipe: every inserted row otherwise pays one probe
+    per index, and a post-load rebuild is a single sort instead.
+    """
+    rows = db.execute(text("""
+        SELECT indexname, indexdef FROM pg_indexes
+        WHERE schemaname = current_schema()
+        AND tablename = 'relationships'
+        AND indexdef NOT LIKE 'CREATE UNIQUE%'
+    """)).all()
+    for row in rows:
+        db.execute(text(f'DROP INDEX {row.indexname}'))
+    return [row.indexdef for row in rows]
+
+
+def _rebuild_indexes(db, index_defs: List[str]) -> None:
+    """Recreate the captured indexes with extra sort memory."""
+    db.execute(text("SET LOCAL maintenance_work_mem = '256MB'"))
+    for index_def in index_defs:
+        db.execute(text(index_def))
 
 
 def clear_all_data(db) -> None:
@@ -62,24 +269,13 @@ def clear_all_data(db) -> None:
     logger.info("Clearing all existing data...")
     
     try:
-        # Delete in reverse order of dependencies
-        db.execute(text("DELETE FROM risk_scores"))
-        db.execute(text("DELETE FROM events"))
-        db.execute(text("DELETE FROM relationships"))
-        db.execute(text("DELETE FROM properties"))
-        db.execute(text("DELETE FROM entities"))
-        db.execute(text("DELETE FROM addresses"))
-        db.execute(text("DELETE FROM people"))
-        
-        # Reset sequences
-        db.execute(text("ALTER SEQUENCE entities_id_seq RESTART WITH 1"))
-        db.execute(text("ALTER SEQUENCE people_id_seq RESTART WITH 1"))
-        db.execute(text("ALTER SEQUENCE addresses_id_seq RESTART WITH 1"))
-        db.execute(text("ALTER SEQUENCE properties_id_seq RESTART WITH 1"))
-        db.execute(text("ALTER SEQUENCE relationships_id_seq RESTART WITH 1"))
-        db.execute(text("ALTER SEQUENCE events_id_seq RESTART WITH 1"))
-        db.execute(text("ALTER SEQUENCE risk_scores_id_seq RESTART WITH 1"))
-        
+        # One TRUNCATE covers all tables (O(1) file unlink, no per-row WAL)
+        # and RESTART IDENTITY resets every sequence in the same statement.
+        db.execute(text(
+            "TRUNCATE TABLE risk_scores, events, relationships, properties, "
+            "entities, addresses, people RESTART IDENTITY CASCADE"
+        ))
+
         db.commit()
         logger.info("All data cleared successfully")
     except Exception as e:
@@ -88,7 +284,7 @@ def clear_all_data(db) -> None:
         raise
 
 
-def create_people(db) -> Dict[str, Person]:
+def create_people(db, batch_size: int = 1000) -> Dict[tuple, int]:
     """Create sample people (registered agents, officers, property owners)."""
     logger.info("Creating people...")
     
@@ -112,22 +308,44 @@ def create_people(db) -> Dict[str, Person]:
         {"full_name": "Patricia White", "role": "owner"},
     ]
     
-    people = {}
-    for person_data in people_data:
-        person = Person(
-            full_name=person_data["full_name"],
-            normalized_name=normalize_name(person_data["full_name"])
-        )
-        db.add(person)
-        people[person_data["role"] + "_" + person_data["full_name"].replace(" ", "_").lower()] = person
-    
-    db.commit()
+    # Precompute the normalized column in one pass so the mapping build
+    # below is pure dict assembly.
+    normalized_names = [normalize_name(p["full_name"]) for p in people_data]
+    mappings = [
+        {
+            "full_name": p["full_name"],
+            "normalized_name": normalized
+        }
+        for p, normalized in zip(people_data, normalized_names)
+    ]
+    # Insert in key order: sequential B-tree leaf appends on the
+    # normalized_name index instead of random page touches.
+    mappings.sort(key=lambda m: m["normalized_name"])
+    # A single Core executemany INSERT..RETURNING on the mapped table:
+    # no ORM instance construction at all, and SQLAlchemy batches the rows
+    # via insertmanyvalues so all ids come back in one round trip.
+    rows = _insert_chunked(
+        db,
+        Person.__table__.insert().returning(Person.id, Person.normalized_name),
+        mappings,
+        batch_size
+    )
+    ids_by_name = {row.normalized_name: row.id for row in rows}
+
+    # Index ids by (role, full_name): later phases only ever need the id,
+    # and resolve agents and officers with one tuple hash instead of
+    # rebuilding a concatenated string key per row.
+    people = {
+        (p["role"], p["full_name"]): ids_by_name[normalized]
+        for p, normalized in zip(people_data, normalized_names)
+    }
+
     logger.info(f"Created {len(people_data)} people")
     
     return people
 
 
-def create_addresses(db) -> Dict[str, Address]:
+def create_addresses(db, batch_size: int = 1000) -> Dict[str, int]:
     """Create sample addresses (business, residential, property situs)."""
     logger.info("Creating addresses...")
     
@@ -138,6 +356,9 @@ def create_addresses(db) -> Dict[str, Address]:
         {"line1": "789 Enterprise Way", "line2": "Floor 3", "city": "Ocala", "state": "FL", "postal_code": "34472", "county": "Marion", "type": "business_shared"},
         {"line1": "321 Industry Drive", "line2": None, "city": "Silver Springs", "state": "FL", "postal_code": "34488", "county": "Marion", "type": "business"},
         {"line1": "555 Corporate Park", "line2": "Building A", "city": "Ocala", "state": "FL", "postal_code": "34473", "county": "Marion", "type": "business"},
+        {"line1": "777 Gateway Plaza", "line2": "Suite 210", "city": "Belleview", "state": "FL", "postal_code": "34420", "county": "Marion", "type": "business"},
+        {"line1": "999 Market Street", "line2": None, "city": "Ocala", "state": "FL", "postal_code": "34478", "county": "Marion", "type": "business"},
+        {"line1": "246 Professional Center", "line2": "Suite 12", "city": "Ocala", "state": "FL", "postal_code": "34477", "county": "Marion", "type": "business_shared"},
         
         # Residential addresses
         {"line1": "1010 Oak Avenue", "line2": None, "city": "Ocala", "state": "FL", "postal_code": "34470", "county": "Marion", "type": "residential"},
@@ -152,42 +373,59 @@ def create_addresses(db) -> Dict[str, Address]:
         {"line1": "8080 Commercial Street", "line2": None, "city": "Ocala", "state": "FL", "postal_code": "34474", "county": "Marion", "type": "property"},
         {"line1": "9090 Industrial Blvd", "line2": None, "city": "Ocala", "state": "FL", "postal_code": "34475", "county": "Marion", "type": "property"},
         {"line1": "1515 Residential Circle", "line2": None, "city": "Ocala", "state": "FL", "postal_code": "34476", "county": "Marion", "type": "property"},
+        {"line1": "2525 Grove Road", "line2": None, "city": "Belleview", "state": "FL", "postal_code": "34421", "county": "Marion", "type": "property"},
+        {"line1": "3535 Timber Trail", "line2": None, "city": "Fort McCoy", "state": "FL", "postal_code": "32134", "county": "Marion", "type": "property"},
+        {"line1": "4545 Meadow Lane", "line2": None, "city": "Summerfield", "state": "FL", "postal_code": "34491", "county": "Marion", "type": "property"},
     ]
     
+    # All hashes in one pass up front; the mapping build stays pure
+    # dict assembly.
+    hashes = [
+        normalize_address_hash(
+            addr_data["line1"],
+            addr_data["city"],
+            addr_data["state"],
+            addr_data["postal_code"]
+        )
+        for addr_data in addresses_data
+    ]
+    mappings = [
+        {
+            "line1": addr_data["line1"],
+            "line2": addr_data["line2"],
+            "city": addr_data["city"],
+            "state": addr_data["state"],
+            "postal_code": addr_data["postal_code"],
+            "county": addr_data["county"],
+            "country": "US",
+            "normalized_hash": normalized_hash
+        }
+        for addr_data, normalized_hash in zip(addresses_data, hashes)
+    ]
+    mappings.sort(key=lambda m: m["normalized_hash"])
+    rows = _insert_chunked(
+        db,
+        Address.__table__.insert().returning(Address.id, Address.normalized_hash),
+        mappings,
+        batch_size
+    )
+    ids_by_hash = {row.normalized_hash: row.id for row in rows}
+
     addresses = {}
     type_counters = {}
-    
-    for addr_data in addresses_data:
-        address = Address(
-            line1=addr_data["line1"],
-            line2=addr_data["line2"],
-            city=addr_data["city"],
-            state=addr_data["state"],
-            postal_code=addr_data["postal_code"],
-            county=addr_data["county"],
-            country="US",
-            normalized_hash=normalize_address_hash(
-                addr_data["line1"],
-                addr_data["city"],
-                addr_data["state"],
-                addr_data["postal_code"]
-            )
-        )
-        db.add(address)
-        
+    for addr_data, normalized_hash in zip(addresses_data, hashes):
         # Generate unique key with counter
         addr_type = addr_data["type"]
         counter = type_counters.get(addr_type, 0)
-        addresses[f"{addr_type}_{counter}"] = address
+        addresses[f"{addr_type}_{counter}"] = ids_by_hash[normalized_hash]
         type_counters[addr_type] = counter + 1
     
-    db.commit()
     logger.info(f"Created {len(addresses_data)} addresses")
     
     return addresses
 
 
-def create_entities(db, people: Dict[str, Person], addresses: Dict[str, Address]) -> Dict[str, Entity]:
+def create_entities(db, people: Dict[tuple, int], addresses: Dict[str, int], batch_size: int = 1000) -> Dict[str, int]:
     """Create sample business entities with varied attributes.
     
     Note: people and addresses must be committed to the database before calling this function,
@@ -195,176 +433,187 @@ def create_entities(db, people: Dict[str, Person], addresses: Dict[str, Address]
     """
     logger.info("Creating entities...")
     
-    today = date.today()
-    
     entities_data = [
         # New LLC (< 90 days) - HIGH RISK: New Entity
-        {
-            "external_id": "L23001234",
-            "source_system": "sunbiz",
-            "type": "llc",
-            "legal_name": "Rapid Property Holdings LLC",
-            "jurisdiction": "FL",
-            "status": "ACTIVE",
-            "formation_date": today - timedelta(days=45),
-            "ein_available": False,
-            "ein_verified": False,
-            "agent": "agent_corporate_agents_inc",
-            "address": "business_shared_0"
-        },
+        EntityRow(
+            external_id="L23001234",
+            source_system="sunbiz",
+            type="llc",
+            legal_name="Rapid Property Holdings LLC",
+            jurisdiction="FL",
+            status="ACTIVE",
+            formation_date=_days_ago(45),
+            ein_available=False,
+            ein_verified=False,
+            agent=("agent", "Corporate Agents Inc"),
+            address="business_shared_0"
+        ),
         # Medium-age LLC (~1 year)
-        {
-            "external_id": "L22005678",
-            "source_system": "sunbiz",
-            "type": "llc",
-            "legal_name": "Sunshine Investments LLC",
-            "jurisdiction": "FL",
-            "status": "ACTIVE",
-            "formation_date": today - timedelta(days=365),
-            "ein_available": True,
-            "ein_verified": True,
-            "agent": "agent_john_smith",
-            "address": "business_1"
-        },
+        EntityRow(
+            external_id="L22005678",
+            source_system="sunbiz",
+            type="llc",
+            legal_name="Sunshine Investments LLC",
+            jurisdiction="FL",
+            status="ACTIVE",
+            formation_date=_days_ago(365),
+            ein_available=True,
+            ein_verified=True,
+            agent=("agent", "John Smith"),
+            address="business_1"
+        ),
         # Established LLC (> 2 years) - Multi-property owner
-        {
-            "external_id": "L20009999",
-            "source_system": "sunbiz",
-            "type": "llc",
-            "legal_name": "Triple Crown Properties LLC",
-            "jurisdiction": "FL",
-            "status": "ACTIVE",
-            "formation_date": today - timedelta(days=900),
-            "ein_available": True,
-            "ein_verified": True,
-            "agent": "agent_sarah_johnson",
-            "address": "business_2"
-        },
+        EntityRow(
+            external_id="L20009999",
+            source_system="sunbiz",
+            type="llc",
+            legal_name="Triple Crown Properties LLC",
+            jurisdiction="FL",
+            status="ACTIVE",
+            formation_date=_days_ago(900),
+            ein_available=True,
+            ein_verified=True,
+            agent=("agent", "Sarah Johnson"),
+            address="business_2"
+        ),
         # Corporation (Delaware registered)
-        {
-            "external_id": "C21001111",
-            "source_system": "sunbiz",
-            "type": "corp",
-            "legal_name": "Marion Real Estate Corp",
-            "jurisdiction": "DE",
-            "status": "ACTIVE",
-            "formation_date": today - timedelta(days=1200),
-            "ein_available": True,
-            "ein_verified": True,
-            "agent": "agent_corporate_agents_inc",
-            "address": "business_shared_0"
-        },
+        EntityRow(
+            external_id="C21001111",
+            source_system="sunbiz",
+            type="corp",
+            legal_name="Marion Real Estate Corp",
+            jurisdiction="DE",
+            status="ACTIVE",
+            formation_date=_days_ago(1200),
+            ein_available=True,
+            ein_verified=True,
+            agent=("agent", "Corporate Agents Inc"),
+            address="business_shared_0"
+        ),
         # Corporation (Texas)
-        {
-            "external_id": "C19002222",
-            "source_system": "sunbiz",
-            "type": "corp",
-            "legal_name": "Southern Land Development Corp",
-            "jurisdiction": "TX",
-            "status": "ACTIVE",
-            "formation_date": today - timedelta(days=1800),
-            "ein_available": True,
-            "ein_verified": False,
-            "agent": "agent_michael_brown",
-            "address": "business_3"
-        },
+        EntityRow(
+            external_id="C19002222",
+            source_system="sunbiz",
+            type="corp",
+            legal_name="Southern Land Development Corp",
+            jurisdiction="TX",
+            status="ACTIVE",
+            formation_date=_days_ago(1800),
+            ein_available=True,
+            ein_verified=False,
+            agent=("agent", "Michael Brown"),
+            address="business_3"
+        ),
         # Trust
-        {
-            "external_id": "T20003333",
-            "source_system": "marion_pa",
-            "type": "trust",
-            "legal_name": "Anderson Family Trust",
-            "jurisdiction": "FL",
-            "status": "ACTIVE",
-            "formation_date": today - timedelta(days=2500),
-            "ein_available": True,
-            "ein_verified": True,
-            "agent": "agent_john_smith",
-            "address": "business_4"
-        },
+        EntityRow(
+            external_id="T20003333",
+            source_system="marion_pa",
+            type="trust",
+            legal_name="Anderson Family Trust",
+            jurisdiction="FL",
+            status="ACTIVE",
+            formation_date=_days_ago(2500),
+            ein_available=True,
+            ein_verified=True,
+            agent=("agent", "John Smith"),
+            address="business_4"
+        ),
         # Nonprofit
-        {
-            "external_id": "N18004444",
-            "source_system": "sunbiz",
-            "type": "nonprofit",
-            "legal_name": "Marion County Agricultural Foundation",
-            "jurisdiction": "FL",
-            "status": "ACTIVE",
-            "formation_date": today - timedelta(days=2000),
-            "ein_available": True,
-            "ein_verified": True,
-            "agent": "agent_sarah_johnson",
-            "address": "business_1"
-        },
+        EntityRow(
+            external_id="N18004444",
+            source_system="sunbiz",
+            type="nonprofit",
+            legal_name="Marion County Agricultural Foundation",
+            jurisdiction="FL",
+            status="ACTIVE",
+            formation_date=_days_ago(2000),
+            ein_available=True,
+            ein_verified=True,
+            agent=("agent", "Sarah Johnson"),
+            address="business_1"
+        ),
         # Inactive LLC
-        {
-            "external_id": "L21005555",
-            "source_system": "sunbiz",
-            "type": "llc",
-            "legal_name": "Dormant Holdings LLC",
-            "jurisdiction": "FL",
-            "status": "INACTIVE",
-            "formation_date": today - timedelta(days=600),
-            "ein_available": True,
-            "ein_verified": False,
-            "agent": "agent_corporate_agents_inc",
-            "address": "business_shared_2"
-        },
+        EntityRow(
+            external_id="L21005555",
+            source_system="sunbiz",
+            type="llc",
+            legal_name="Dormant Holdings LLC",
+            jurisdiction="FL",
+            status="INACTIVE",
+            formation_date=_days_ago(600),
+            ein_available=True,
+            ein_verified=False,
+            agent=("agent", "Corporate Agents Inc"),
+            address="business_shared_2"
+        ),
         # Dissolved LLC - STATUS CHANGE risk
-        {
-            "external_id": "L20006666",
-            "source_system": "sunbiz",
-            "type": "llc",
-            "legal_name": "Dissolved Ventures LLC",
-            "jurisdiction": "FL",
-            "status": "DISSOLVED",
-            "formation_date": today - timedelta(days=1100),
-            "ein_available": True,
-            "ein_verified": True,
-            "agent": "agent_michael_brown",
-            "address": "business_shared_2"
-        },
+        EntityRow(
+            external_id="L20006666",
+            source_system="sunbiz",
+            type="llc",
+            legal_name="Dissolved Ventures LLC",
+            jurisdiction="FL",
+            status="DISSOLVED",
+            formation_date=_days_ago(1100),
+            ein_available=True,
+            ein_verified=True,
+            agent=("agent", "Michael Brown"),
+            address="business_shared_2"
+        ),
         # Another entity at shared address (ADDRESS CONCENTRATION)
-        {
-            "external_id": "L22007777",
-            "source_system": "sunbiz",
-            "type": "llc",
-            "legal_name": "Shared Space LLC",
-            "jurisdiction": "FL",
-            "status": "ACTIVE",
-            "formation_date": today - timedelta(days=200),
-            "ein_available": False,
-            "ein_verified": False,
-            "agent": "agent_corporate_agents_inc",
-            "address": "business_shared_0"
-        },
+        EntityRow(
+            external_id="L22007777",
+            source_system="sunbiz",
+            type="llc",
+            legal_name="Shared Space LLC",
+            jurisdiction="FL",
+            status="ACTIVE",
+            formation_date=_days_ago(200),
+            ein_available=False,
+            ein_verified=False,
+            agent=("agent", "Corporate Agents Inc"),
+            address="business_shared_0"
+        ),
     ]
     
-    entities = {}
-    for entity_data in entities_data:
-        entity = Entity(
-            external_id=entity_data["external_id"],
-            source_system=entity_data["source_system"],
-            type=entity_data["type"],
-            legal_name=entity_data["legal_name"],
-            jurisdiction=entity_data["jurisdiction"],
-            status=entity_data["status"],
-            formation_date=entity_data["formation_date"],
-            ein_available=entity_data["ein_available"],
-            ein_verified=entity_data["ein_verified"],
-            registered_agent_id=people[entity_data["agent"]].id,
-            primary_address_id=addresses[entity_data["address"]].id
-        )
-        db.add(entity)
-        entities[entity_data["legal_name"].replace(" ", "_").lower()] = entity
+    mappings = [
+        {
+            "external_id": entity_data.external_id,
+            "source_system": entity_data.source_system,
+            "type": entity_data.type,
+            "legal_name": entity_data.legal_name,
+            "jurisdiction": entity_data.jurisdiction,
+            "status": entity_data.status,
+            "formation_date": entity_data.formation_date,
+            "ein_available": entity_data.ein_available,
+            "ein_verified": entity_data.ein_verified,
+            "registered_agent_id": people[entity_data.agent],
+            "primary_address_id": addresses[entity_data.address]
+        }
+        for entity_data in entities_data
+    ]
+    mappings.sort(key=lambda m: m["external_id"])
+    rows = _insert_chunked(
+        db,
+        Entity.__table__.insert().returning(Entity.id, Entity.external_id),
+        mappings,
+        batch_size
+    )
+    ids_by_external_id = {row.external_id: row.id for row in rows}
+
+    # Keyed by external_id: already unique, and needs no string transform
+    # when relationship and event rows reference an entity.
+    entities = {
+        entity_data.external_id: ids_by_external_id[entity_data.external_id]
+        for entity_data in entities_data
+    }
     
-    db.commit()
     logger.info(f"Created {len(entities_data)} entities")
     
     return entities
 
 
-def create_properties(db, addresses: Dict[str, Address]) -> Dict[str, Property]:
+def create_properties(db, addresses: Dict[str, int], batch_size: int = 1000) -> Dict[str, int]:
     """Create sample properties in Marion County, FL.
     
     Note: addresses must be committed to the database before calling this function,
@@ -372,176 +621,198 @@ def create_properties(db, addresses: Dict[str, Address]) -> Dict[str, Property]:
     """
     logger.info("Creating properties...")
     
-    today = date.today()
-    
     properties_data = [
         # Residential properties
-        {
-            "parcel_id": "10234-001-000",
-            "county": "Marion",
-            "jurisdiction": "FL",
-            "address": "property_0",
-            "land_use_code": "0100",  # Single-family residential
-            "acreage": Decimal("0.25"),
-            "last_sale_date": today - timedelta(days=500),
-            "last_sale_price": Decimal("285000.00"),
-            "market_value": Decimal("295000.00"),
-            "assessed_value": Decimal("275000.00"),
-            "homestead_exempt": "Y",
-            "tax_year": "2024"
-        },
-        {
-            "parcel_id": "10234-002-000",
-            "county": "Marion",
-            "jurisdiction": "FL",
-            "address": "property_1",
-            "land_use_code": "0100",
-            "acreage": Decimal("0.50"),
-            "last_sale_date": today - timedelta(days=1200),
-            "last_sale_price": Decimal("195000.00"),
-            "market_value": Decimal("245000.00"),
-            "assessed_value": Decimal("230000.00"),
-            "homestead_exempt": "Y",
-            "tax_year": "2024"
-        },
-        {
-            "parcel_id": "10234-003-000",
-            "county": "Marion",
-            "jurisdiction": "FL",
-            "address": "property_2",
-            "land_use_code": "0100",
-            "acreage": Decimal("0.33"),
-            "last_sale_date": today - timedelta(days=90),  # Recent sale - RAPID TURNOVER
-            "last_sale_price": Decimal("320000.00"),
-            "market_value": Decimal("325000.00"),
-            "assessed_value": Decimal("310000.00"),
-            "homestead_exempt": "Y",  # Potential HOMESTEAD FRAUD with multi-property owner
-            "tax_year": "2024"
-        },
+        PropertyRow(
+            parcel_id="10234-001-000",
+            county="Marion",
+            jurisdiction="FL",
+            address="property_0",
+            land_use_code="0100",  # Single-family residential
+            acreage=Decimal("0.25"),
+            last_sale_date=_days_ago(500),
+            last_sale_price=Decimal("285000.00"),
+            market_value=Decimal("295000.00"),
+            assessed_value=Decimal("275000.00"),
+            homestead_exempt="Y",
+            tax_year="2024"
+        ),
+        PropertyRow(
+            parcel_id="10234-002-000",
+            county="Marion",
+            jurisdiction="FL",
+            address="property_1",
+            land_use_code="0100",
+            acreage=Decimal("0.50"),
+            last_sale_date=_days_ago(1200),
+            last_sale_price=Decimal("195000.00"),
+            market_value=Decimal("245000.00"),
+            assessed_value=Decimal("230000.00"),
+            homestead_exempt="Y",
+            tax_year="2024"
+        ),
+        PropertyRow(
+            parcel_id="10234-003-000",
+            county="Marion",
+            jurisdiction="FL",
+            address="property_2",
+            land_use_code="0100",
+            acreage=Decimal("0.33"),
+            last_sale_date=_days_ago(90),  # Recent sale - RAPID TURNOVER
+            last_sale_price=Decimal("320000.00"),
+            market_value=Decimal("325000.00"),
+            assessed_value=Decimal("310000.00"),
+            homestead_exempt="Y",  # Potential HOMESTEAD FRAUD with multi-property owner
+            tax_year="2024"
+        ),
         # Agricultural properties
-        {
-            "parcel_id": "20456-100-000",
-            "county": "Marion",
-            "jurisdiction": "FL",
-            "address": "property_3",
-            "land_use_code": "0200",  # Agricultural
-            "acreage": Decimal("25.00"),
-            "last_sale_date": today - timedelta(days=800),
-            "last_sale_price": Decimal("450000.00"),
-            "market_value": Decimal("475000.00"),
-            "assessed_value": Decimal("425000.00"),
-            "homestead_exempt": "N",
-            "tax_year": "2024"
-        },
-        {
-            "parcel_id": "20456-101-000",
-            "county": "Marion",
-            "jurisdiction": "FL",
-            "address": "property_4",
-            "land_use_code": "0200",
-            "acreage": Decimal("50.00"),
-            "last_sale_date": None,  # No recent sale
-            "last_sale_price": None,
-            "market_value": Decimal("625000.00"),
-            "assessed_value": Decimal("580000.00"),
-            "homestead_exempt": "N",
-            "tax_year": "2024"
-        },
+        PropertyRow(
+            parcel_id="20456-100-000",
+            county="Marion",
+            jurisdiction="FL",
+            address="property_3",
+            land_use_code="0200",  # Agricultural
+            acreage=Decimal("25.00"),
+            last_sale_date=_days_ago(800),
+            last_sale_price=Decimal("450000.00"),
+            market_value=Decimal("475000.00"),
+            assessed_value=Decimal("425000.00"),
+            homestead_exempt="N",
+            tax_year="2024"
+        ),
+        PropertyRow(
+            parcel_id="20456-101-000",
+            county="Marion",
+            jurisdiction="FL",
+            address="property_4",
+            land_use_code="0200",
+            acreage=Decimal("50.00"),
+            last_sale_date=None,  # No recent sale
+            last_sale_price=None,
+            market_value=Decimal("625000.00"),
+            assessed_value=Decimal("580000.00"),
+            homestead_exempt="N",
+            tax_year="2024"
+        ),
         # Commercial properties
-        {
-            "parcel_id": "30789-200-000",
-            "county": "Marion",
-            "jurisdiction": "FL",
-            "address": "property_5",
-            "land_use_code": "0400",  # Commercial
-            "acreage": Decimal("2.50"),
-            "last_sale_date": today - timedelta(days=300),
-            "last_sale_price": Decimal("850000.00"),
-            "market_value": Decimal("925000.00"),
-            "assessed_value": Decimal("875000.00"),
-            "homestead_exempt": "N",
-            "tax_year": "2024"
-        },
-        {
-            "parcel_id": "30789-201-000",
-            "county": "Marion",
-            "jurisdiction": "FL",
-            "address": "property_6",
-            "land_use_code": "0400",
-            "acreage": Decimal("1.75"),
-            "last_sale_date": today - timedelta(days=1500),
-            "last_sale_price": Decimal("675000.00"),
-            "market_value": Decimal("825000.00"),
-            "assessed_value": Decimal("780000.00"),
-            "homestead_exempt": "N",
-            "tax_year": "2023"
-        },
+        PropertyRow(
+            parcel_id="30789-200-000",
+            county="Marion",
+            jurisdiction="FL",
+            address="property_5",
+            land_use_code="0400",  # Commercial
+            acreage=Decimal("2.50"),
+            last_sale_date=_days_ago(300),
+            last_sale_price=Decimal("850000.00"),
+            market_value=Decimal("925000.00"),
+            assessed_value=Decimal("875000.00"),
+            homestead_exempt="N",
+            tax_year="2024"
+        ),
+        PropertyRow(
+            parcel_id="30789-201-000",
+            county="Marion",
+            jurisdiction="FL",
+            address="property_6",
+            land_use_code="0400",
+            acreage=Decimal("1.75"),
+            last_sale_date=_days_ago(1500),
+            last_sale_price=Decimal("675000.00"),
+            market_value=Decimal("825000.00"),
+            assessed_value=Decimal("780000.00"),
+            homestead_exempt="N",
+            tax_year="2023"
+        ),
         # Investment properties (for multi-property owner)
-        {
-            "parcel_id": "40123-300-000",
-            "county": "Marion",
-            "jurisdiction": "FL",
-            "address": "property_7",
-            "land_use_code": "0100",
-            "acreage": Decimal("0.40"),
-            "last_sale_date": today - timedelta(days=600),
-            "last_sale_price": Decimal("175000.00"),
-            "market_value": Decimal("195000.00"),
-            "assessed_value": Decimal("180000.00"),
-            "homestead_exempt": "N",
-            "tax_year": "2024"
-        },
-        {
-            "parcel_id": "40123-301-000",
-            "county": "Marion",
-            "jurisdiction": "FL",
-            "address": "property_8",
-            "land_use_code": "0100",
-            "acreage": Decimal("0.35"),
-            "last_sale_date": today - timedelta(days=700),
-            "last_sale_price": Decimal("165000.00"),
-            "market_value": Decimal("185000.00"),
-            "assessed_value": Decimal("175000.00"),
-            "homestead_exempt": "N",
-            "tax_year": "2024"
-        },
-        {
-            "parcel_id": "40123-302-000",
-            "county": "Marion",
-            "jurisdiction": "FL",
-            "address": "property_9",
-            "land_use_code": "0100",
-            "acreage": Decimal("0.45"),
-            "last_sale_date": today - timedelta(days=650),
-            "last_sale_price": Decimal("185000.00"),
-            "market_value": Decimal("205000.00"),
-            "assessed_value": Decimal("190000.00"),
-            "homestead_exempt": "N",
-            "tax_year": "2024"
-        },
+        PropertyRow(
+            parcel_id="40123-300-000",
+            county="Marion",
+            jurisdiction="FL",
+            address="property_7",
+            land_use_code="0100",
+            acreage=Decimal("0.40"),
+            last_sale_date=_days_ago(600),
+            last_sale_price=Decimal("175000.00"),
+            market_value=Decimal("195000.00"),
+            assessed_value=Decimal("180000.00"),
+            homestead_exempt="N",
+            tax_year="2024"
+        ),
+        PropertyRow(
+            parcel_id="40123-301-000",
+            county="Marion",
+            jurisdiction="FL",
+            address="property_8",
+            land_use_code="0100",
+            acreage=Decimal("0.35"),
+            last_sale_date=_days_ago(700),
+            last_sale_price=Decimal("165000.00"),
+            market_value=Decimal("185000.00"),
+            assessed_value=Decimal("175000.00"),
+            homestead_exempt="N",
+            tax_year="2024"
+        ),
+        PropertyRow(
+            parcel_id="40123-302-000",
+            county="Marion",
+            jurisdiction="FL",
+            address="property_9",
+            land_use_code="0100",
+            acreage=Decimal("0.45"),
+            last_sale_date=_days_ago(650),
+            last_sale_price=Decimal("185000.00"),
+            market_value=Decimal("205000.00"),
+            assessed_value=Decimal("190000.00"),
+            homestead_exempt="N",
+            tax_year="2024"
+        ),
     ]
     
-    properties = {}
-    for prop_data in properties_data:
-        prop = Property(
-            parcel_id=prop_data["parcel_id"],
-            county=prop_data["county"],
-            jurisdiction=prop_data["jurisdiction"],
-            situs_address_id=addresses[prop_data["address"]].id,
-            appraiser_url=f"https://www.pa.marion.fl.us/display.asp?parcel={prop_data['parcel_id']}",
-            land_use_code=prop_data["land_use_code"],
-            acreage=prop_data["acreage"],
-            last_sale_date=prop_data["last_sale_date"],
-            last_sale_price=prop_data["last_sale_price"],
-            market_value=prop_data["market_value"],
-            assessed_value=prop_data["assessed_value"],
-            homestead_exempt=prop_data["homestead_exempt"],
-            tax_year=prop_data["tax_year"]
+    mappings = [
+        {
+            "parcel_id": prop_data.parcel_id,
+            "county": prop_data.county,
+            "jurisdiction": prop_data.jurisdiction,
+            "situs_address_id": addresses[prop_data.address],
+            "appraiser_url": f"https://www.pa.marion.fl.us/display.asp?parcel={prop_data.parcel_id}",
+            "land_use_code": prop_data.land_use_code,
+            "acreage": prop_data.acreage,
+            "last_sale_date": prop_data.last_sale_date,
+            "last_sale_price": prop_data.last_sale_price,
+            "market_value": prop_data.market_value,
+            "assessed_value": prop_data.assessed_value,
+            "homestead_exempt": prop_data.homestead_exempt,
+            "tax_year": prop_data.tax_year
+        }
+        for prop_data in properties_data
+    ]
+    mappings.sort(key=lambda m: m["parcel_id"])
+    property_columns = [
+        "parcel_id", "county", "jurisdiction", "situs_address_id",
+        "appraiser_url", "land_use_code", "acreage", "last_sale_date",
+        "last_sale_price", "market_value", "assessed_value",
+        "homestead_exempt", "tax_year"
+    ]
+    if db.bind.dialect.name == "postgresql":
+        # COPY is the fastest Postgres load path; ids are selected back
+        # by parcel afterwards since COPY has no RETURNING.
+        _copy_rows(
+            db, "properties", property_columns,
+            [tuple(m[c] for c in property_columns) for m in mappings]
         )
-        db.add(prop)
-        properties[prop_data["parcel_id"]] = prop
+        rows = db.execute(
+            text("SELECT id, parcel_id FROM properties WHERE parcel_id = ANY(:parcels)"),
+            {"parcels": [m["parcel_id"] for m in mappings]}
+        )
+    else:
+        rows = _insert_chunked(
+            db,
+            Property.__table__.insert().returning(Property.id, Property.parcel_id),
+            mappings,
+            batch_size
+        )
+    properties = {row.parcel_id: row.id for row in rows}
     
-    db.commit()
     logger.info(f"Created {len(properties_data)} properties")
     
     return properties
@@ -549,10 +820,11 @@ def create_properties(db, addresses: Dict[str, Address]) -> Dict[str, Property]:
 
 def create_relationships(
     db,
-    entities: Dict[str, Entity],
-    people: Dict[str, Person],
-    addresses: Dict[str, Address],
-    properties: Dict[str, Property]
+    entities: Dict[str, int],
+    people: Dict[tuple, int],
+    addresses: Dict[str, int],
+    properties: Dict[str, int],
+    batch_size: int = 1000
 ) -> None:
     """Create relationships between entities, people, addresses, and properties.
     
@@ -560,170 +832,261 @@ def create_relationships(
     as we use their IDs to create relationship records.
     """
     logger.info("Creating relationships...")
+
+    # Indexes off during the load, rebuilt in one pass afterwards. The
+    # schema declares no foreign keys, so there are no FK checks to defer.
+    index_defs = []
+    if db.bind.dialect.name == "postgresql":
+        index_defs = _drop_relationship_indexes(db)
+
+    relationships_data = _RELATIONSHIPS
     
-    today = date.today()
-    
-    relationships_data = [
-        # Entity -> Agent relationships (already captured in entity.registered_agent_id, but also in graph)
-        {"from_type": "entity", "from": "rapid_property_holdings_llc", "to_type": "person", "to": "agent_corporate_agents_inc", "rel_type": "agent_for", "source": "sunbiz", "confidence": 1.0},
-        {"from_type": "entity", "from": "sunshine_investments_llc", "to_type": "person", "to": "agent_john_smith", "rel_type": "agent_for", "source": "sunbiz", "confidence": 1.0},
-        {"from_type": "entity", "from": "triple_crown_properties_llc", "to_type": "person", "to": "agent_sarah_johnson", "rel_type": "agent_for", "source": "sunbiz", "confidence": 1.0},
-        {"from_type": "entity", "from": "marion_real_estate_corp", "to_type": "person", "to": "agent_corporate_agents_inc", "rel_type": "agent_for", "source": "sunbiz", "confidence": 1.0},
-        {"from_type": "entity", "from": "southern_land_development_corp", "to_type": "person", "to": "agent_michael_brown", "rel_type": "agent_for", "source": "sunbiz", "confidence": 1.0},
-        {"from_type": "entity", "from": "anderson_family_trust", "to_type": "person", "to": "agent_john_smith", "rel_type": "agent_for", "source": "marion_pa", "confidence": 1.0},
-        {"from_type": "entity", "from": "marion_county_agricultural_foundation", "to_type": "person", "to": "agent_sarah_johnson", "rel_type": "agent_for", "source": "sunbiz", "confidence": 1.0},
-        {"from_type": "entity", "from": "dormant_holdings_llc", "to_type": "person", "to": "agent_corporate_agents_inc", "rel_type": "agent_for", "source": "sunbiz", "confidence": 1.0},
-        {"from_type": "entity", "from": "dissolved_ventures_llc", "to_type": "person", "to": "agent_michael_brown", "rel_type": "agent_for", "source": "sunbiz", "confidence": 1.0},
-        {"from_type": "entity", "from": "shared_space_llc", "to_type": "person", "to": "agent_corporate_agents_inc", "rel_type": "agent_for", "source": "sunbiz", "confidence": 1.0},
-        
-        # Entity -> Officer relationships
-        {"from_type": "entity", "from": "rapid_property_holdings_llc", "to_type": "person", "to": "officer_robert_davis", "rel_type": "officer", "source": "sunbiz", "confidence": 1.0},
-        {"from_type": "entity", "from": "sunshine_investments_llc", "to_type": "person", "to": "officer_jennifer_wilson", "rel_type": "officer", "source": "sunbiz", "confidence": 1.0},
-        {"from_type": "entity", "from": "marion_real_estate_corp", "to_type": "person", "to": "officer_david_martinez", "rel_type": "officer", "source": "sunbiz", "confidence": 1.0},
-        {"from_type": "entity", "from": "southern_land_development_corp", "to_type": "person", "to": "officer_maria_garcia", "rel_type": "officer", "source": "sunbiz", "confidence": 1.0},
-        
-        # Entity -> Located At -> Address
-        {"from_type": "entity", "from": "rapid_property_holdings_llc", "to_type": "address", "to": "business_shared_0", "rel_type": "located_at", "source": "sunbiz", "confidence": 1.0},
-        {"from_type": "entity", "from": "marion_real_estate_corp", "to_type": "address", "to": "business_shared_0", "rel_type": "located_at", "source": "sunbiz", "confidence": 1.0},
-        {"from_type": "entity", "from": "dormant_holdings_llc", "to_type": "address", "to": "business_shared_2", "rel_type": "located_at", "source": "sunbiz", "confidence": 1.0},
-        {"from_type": "entity", "from": "dissolved_ventures_llc", "to_type": "address", "to": "business_shared_2", "rel_type": "located_at", "source": "sunbiz", "confidence": 1.0},
-        {"from_type": "entity", "from": "shared_space_llc", "to_type": "address", "to": "business_shared_0", "rel_type": "located_at", "source": "sunbiz", "confidence": 1.0},
-        
-        # Entity -> Owns -> Property (HIGH PROPERTY VOLUME for Triple Crown)
-        {"from_type": "entity", "from": "triple_crown_properties_llc", "to_type": "property", "to": "10234-001-000", "rel_type": "owns", "source": "marion_pa", "confidence": 0.95, "start_date": today - timedelta(days=500)},
-        {"from_type": "entity", "from": "triple_crown_properties_llc", "to_type": "property", "to": "40123-300-000", "rel_type": "owns", "source": "marion_pa", "confidence": 0.95, "start_date": today - timedelta(days=600)},
-        {"from_type": "entity", "from": "triple_crown_properties_llc", "to_type": "property", "to": "40123-301-000", "rel_type": "owns", "source": "marion_pa", "confidence": 0.95, "start_date": today - timedelta(days=700)},
-        {"from_type": "entity", "from": "triple_crown_properties_llc", "to_type": "property", "to": "40123-302-000", "rel_type": "owns", "source": "marion_pa", "confidence": 0.95, "start_date": today - timedelta(days=650)},
-        
-        # Other entity property ownership
-        {"from_type": "entity", "from": "sunshine_investments_llc", "to_type": "property", "to": "10234-002-000", "rel_type": "owns", "source": "marion_pa", "confidence": 0.90, "start_date": today - timedelta(days=1200)},
-        {"from_type": "entity", "from": "rapid_property_holdings_llc", "to_type": "property", "to": "10234-003-000", "rel_type": "owns", "source": "marion_pa", "confidence": 0.92, "start_date": today - timedelta(days=90)},
-        {"from_type": "entity", "from": "southern_land_development_corp", "to_type": "property", "to": "20456-100-000", "rel_type": "owns", "source": "marion_pa", "confidence": 0.88, "start_date": today - timedelta(days=800)},
-        {"from_type": "entity", "from": "anderson_family_trust", "to_type": "property", "to": "20456-101-000", "rel_type": "owns", "source": "marion_pa", "confidence": 1.0},
-        {"from_type": "entity", "from": "marion_real_estate_corp", "to_type": "property", "to": "30789-200-000", "rel_type": "owns", "source": "marion_pa", "confidence": 0.93, "start_date": today - timedelta(days=300)},
-        {"from_type": "entity", "from": "marion_county_agricultural_foundation", "to_type": "property", "to": "30789-201-000", "rel_type": "owns", "source": "marion_pa", "confidence": 0.85, "start_date": today - timedelta(days=1500)},
-        
-        # Property -> Located At -> Address
-        {"from_type": "property", "from": "10234-001-000", "to_type": "address", "to": "property_0", "rel_type": "located_at", "source": "marion_pa", "confidence": 1.0},
-        {"from_type": "property", "from": "10234-002-000", "to_type": "address", "to": "property_1", "rel_type": "located_at", "source": "marion_pa", "confidence": 1.0},
-        {"from_type": "property", "from": "10234-003-000", "to_type": "address", "to": "property_2", "rel_type": "located_at", "source": "marion_pa", "confidence": 1.0},
-        {"from_type": "property", "from": "20456-100-000", "to_type": "address", "to": "property_3", "rel_type": "located_at", "source": "marion_pa", "confidence": 1.0},
-        {"from_type": "property", "from": "20456-101-000", "to_type": "address", "to": "property_4", "rel_type": "located_at", "source": "marion_pa", "confidence": 1.0},
-        {"from_type": "property", "from": "30789-200-000", "to_type": "address", "to": "property_5", "rel_type": "located_at", "source": "marion_pa", "confidence": 1.0},
-        {"from_type": "property", "from": "30789-201-000", "to_type": "address", "to": "property_6", "rel_type": "located_at", "source": "marion_pa", "confidence": 1.0},
-        {"from_type": "property", "from": "40123-300-000", "to_type": "address", "to": "property_7", "rel_type": "located_at", "source": "marion_pa", "confidence": 1.0},
-        {"from_type": "property", "from": "40123-301-000", "to_type": "address", "to": "property_8", "rel_type": "located_at", "source": "marion_pa", "confidence": 1.0},
-        {"from_type": "property", "from": "40123-302-000", "to_type": "address", "to": "property_9", "rel_type": "located_at", "source": "marion_pa", "confidence": 1.0},
+    # Two dict probes per row instead of up to eight type comparisons.
+    lookup = {
+        "entity": entities,
+        "person": people,
+        "address": addresses,
+        "property": properties,
+    }
+    mappings = [
+        {
+            "from_type": rel_data.from_type,
+            "from_id": lookup[rel_data.from_type][rel_data.from_ref],
+            "to_type": rel_data.to_type,
+            "to_id": lookup[rel_data.to_type][rel_data.to_ref],
+            "rel_type": rel_data.rel_type,
+            "source_system": rel_data.source,
+            "start_date": rel_data.start_date,
+            "end_date": rel_data.end_date,
+            "confidence": _confidence(rel_data.confidence)
+        }
+        for rel_data in relationships_data
     ]
-    
-    for rel_data in relationships_data:
-        # Get the actual objects
-        if rel_data["from_type"] == "entity":
-            from_id = entities[rel_data["from"]].id
-        elif rel_data["from_type"] == "person":
-            from_id = people[rel_data["from"]].id
-        elif rel_data["from_type"] == "address":
-            from_id = addresses[rel_data["from"]].id
-        elif rel_data["from_type"] == "property":
-            from_id = properties[rel_data["from"]].id
-        
-        if rel_data["to_type"] == "entity":
-            to_id = entities[rel_data["to"]].id
-        elif rel_data["to_type"] == "person":
-            to_id = people[rel_data["to"]].id
-        elif rel_data["to_type"] == "address":
-            to_id = addresses[rel_data["to"]].id
-        elif rel_data["to_type"] == "property":
-            to_id = properties[rel_data["to"]].id
-        
-        relationship = Relationship(
-            from_type=rel_data["from_type"],
-            from_id=from_id,
-            to_type=rel_data["to_type"],
-            to_id=to_id,
-            rel_type=rel_data["rel_type"],
-            source_system=rel_data["source"],
-            start_date=rel_data.get("start_date"),
-            end_date=rel_data.get("end_date"),
-            confidence=Decimal(str(rel_data["confidence"]))
+
+    relationship_columns = [
+        "from_type", "from_id", "to_type", "to_id", "rel_type",
+        "source_system", "start_date", "end_date", "confidence"
+    ]
+    if db.bind.dialect.name == "postgresql":
+        _copy_rows(
+            db, "relationships", relationship_columns,
+            [tuple(m[c] for c in relationship_columns) for m in mappings]
         )
-        db.add(relationship)
-    
-    db.commit()
-    logger.info(f"Created {len(relationships_data)} relationships")
+    else:
+        _insert_chunked(db, Relationship.__table__.insert(), mappings, batch_size)
+
+    # The mechanical relationship groups are already encoded as foreign
+    # keys on the base tables, so they are derived with set-based
+    # INSERT ... SELECT statements instead of hand-maintained literals:
+    # agent_for and located_at for every seeded entity, and located_at
+    # for every seeded property. Only the rows that carry per-row data
+    # (officer links, ownership confidence/start_date) stay in Python.
+    entity_ids = list(entities.values())
+    property_ids = list(properties.values())
+
+    derived = db.execute(text("""
+        INSERT INTO relationships (
+            from_type, from_id, to_type, to_id, rel_type, source_system, confidence
+        )
+        SELECT 'entity', e.id, 'person', e.registered_agent_id, 'agent_for',
+               e.source_system, 1.0
+        FROM entities e
+        WHERE e.id = ANY(:entity_ids) AND e.registered_agent_id IS NOT NULL
+    """), {"entity_ids": entity_ids}).rowcount
+
+    derived += db.execute(text("""
+        INSERT INTO relationships (
+            from_type, from_id, to_type, to_id, rel_type, source_system, confidence
+        )
+        SELECT 'entity', e.id, 'address', e.primary_address_id, 'located_at',
+               e.source_system, 1.0
+        FROM entities e
+        WHERE e.id = ANY(:entity_ids) AND e.primary_address_id IS NOT NULL
+    """), {"entity_ids": entity_ids}).rowcount
+
+    derived += db.execute(text("""
+        INSERT INTO relationships (
+            from_type, from_id, to_type, to_id, rel_type, source_system, confidence
+        )
+        SELECT 'property', p.id, 'address', p.situs_address_id, 'located_at',
+               'marion_pa', 1.0
+        FROM properties p
+        WHERE p.id = ANY(:property_ids) AND p.situs_address_id IS NOT NULL
+    """), {"property_ids": property_ids}).rowcount
+
+    if index_defs:
+        _rebuild_indexes(db, index_defs)
+
+    logger.info(f"Created {len(relationships_data) + derived} relationships "
+                f"({derived} derived from base-table foreign keys)")
 
 
-def create_events(db, entities: Dict[str, Entity]) -> None:
+def create_events(db, entities: Dict[str, int], batch_size: int = 1000) -> None:
     """Create time-series events for entities."""
     logger.info("Creating events...")
     
-    today = date.today()
-    
-    events_data = [
-        # Formation events for all entities
-        {"entity": "rapid_property_holdings_llc", "type": "FORMATION", "date": today - timedelta(days=45), "source": "sunbiz", "payload": {"filing_type": "Articles of Organization", "filing_number": "L23001234"}},
-        {"entity": "sunshine_investments_llc", "type": "FORMATION", "date": today - timedelta(days=365), "source": "sunbiz", "payload": {"filing_type": "Articles of Organization", "filing_number": "L22005678"}},
-        {"entity": "triple_crown_properties_llc", "type": "FORMATION", "date": today - timedelta(days=900), "source": "sunbiz", "payload": {"filing_type": "Articles of Organization", "filing_number": "L20009999"}},
-        {"entity": "marion_real_estate_corp", "type": "FORMATION", "date": today - timedelta(days=1200), "source": "sunbiz", "payload": {"filing_type": "Articles of Incorporation", "filing_number": "C21001111", "state_of_incorporation": "Delaware"}},
-        {"entity": "southern_land_development_corp", "type": "FORMATION", "date": today - timedelta(days=1800), "source": "sunbiz", "payload": {"filing_type": "Articles of Incorporation", "filing_number": "C19002222", "state_of_incorporation": "Texas"}},
-        {"entity": "anderson_family_trust", "type": "FORMATION", "date": today - timedelta(days=2500), "source": "marion_pa", "payload": {"trust_type": "Revocable Living Trust", "trustee": "Thomas Anderson"}},
-        {"entity": "marion_county_agricultural_foundation", "type": "FORMATION", "date": today - timedelta(days=2000), "source": "sunbiz", "payload": {"filing_type": "Articles of Incorporation - Nonprofit", "filing_number": "N18004444"}},
-        {"entity": "dormant_holdings_llc", "type": "FORMATION", "date": today - timedelta(days=600), "source": "sunbiz", "payload": {"filing_type": "Articles of Organization", "filing_number": "L21005555"}},
-        {"entity": "dissolved_ventures_llc", "type": "FORMATION", "date": today - timedelta(days=1100), "source": "sunbiz", "payload": {"filing_type": "Articles of Organization", "filing_number": "L20006666"}},
-        {"entity": "shared_space_llc", "type": "FORMATION", "date": today - timedelta(days=200), "source": "sunbiz", "payload": {"filing_type": "Articles of Organization", "filing_number": "L22007777"}},
-        
-        # Officer change events
-        {"entity": "rapid_property_holdings_llc", "type": "OFFICER_CHANGE", "date": today - timedelta(days=30), "source": "sunbiz", "payload": {"change_type": "Manager Appointed", "officer_name": "Robert Davis", "title": "Manager"}},
-        {"entity": "marion_real_estate_corp", "type": "OFFICER_CHANGE", "date": today - timedelta(days=180), "source": "sunbiz", "payload": {"change_type": "Director Change", "officer_name": "David Martinez", "title": "Director"}},
-        
-        # Address change events
-        {"entity": "sunshine_investments_llc", "type": "ADDRESS_CHANGE", "date": today - timedelta(days=120), "source": "sunbiz", "payload": {"old_address": "555 Old Street, Ocala, FL 34470", "new_address": "456 Commerce Blvd, Ocala, FL 34471"}},
-        
-        # Deed transfer events (property sales)
-        {"entity": "triple_crown_properties_llc", "type": "DEED_TRANSFER", "date": today - timedelta(days=500), "source": "marion_pa", "payload": {"parcel_id": "10234-001-000", "transfer_type": "Warranty Deed", "consideration": "285000"}},
-        {"entity": "triple_crown_properties_llc", "type": "DEED_TRANSFER", "date": today - timedelta(days=600), "source": "marion_pa", "payload": {"parcel_id": "40123-300-000", "transfer_type": "Warranty Deed", "consideration": "175000"}},
-        {"entity": "triple_crown_properties_llc", "type": "DEED_TRANSFER", "date": today - timedelta(days=700), "source": "marion_pa", "payload": {"parcel_id": "40123-301-000", "transfer_type": "Warranty Deed", "consideration": "165000"}},
-        {"entity": "triple_crown_properties_llc", "type": "DEED_TRANSFER", "date": today - timedelta(days=650), "source": "marion_pa", "payload": {"parcel_id": "40123-302-000", "transfer_type": "Warranty Deed", "consideration": "185000"}},
-        {"entity": "rapid_property_holdings_llc", "type": "DEED_TRANSFER", "date": today - timedelta(days=90), "source": "marion_pa", "payload": {"parcel_id": "10234-003-000", "transfer_type": "Warranty Deed", "consideration": "320000"}},
-        {"entity": "southern_land_development_corp", "type": "DEED_TRANSFER", "date": today - timedelta(days=800), "source": "marion_pa", "payload": {"parcel_id": "20456-100-000", "transfer_type": "Warranty Deed", "consideration": "450000"}},
-        
-        # Annual report events
-        {"entity": "sunshine_investments_llc", "type": "ANNUAL_REPORT", "date": today - timedelta(days=50), "source": "sunbiz", "payload": {"report_year": "2024", "status": "Filed"}},
-        {"entity": "triple_crown_properties_llc", "type": "ANNUAL_REPORT", "date": today - timedelta(days=60), "source": "sunbiz", "payload": {"report_year": "2024", "status": "Filed"}},
-        
-        # Status change event (dissolution)
-        {"entity": "dissolved_ventures_llc", "type": "STATUS_CHANGE", "date": today - timedelta(days=100), "source": "sunbiz", "payload": {"old_status": "ACTIVE", "new_status": "DISSOLVED", "reason": "Administrative Dissolution"}},
-    ]
+    events_data = _EVENTS
     
-    for event_data in events_data:
-        event = Event(
-            entity_id=entities[event_data["entity"]].id,
-            event_type=event_data["type"],
-            event_date=event_data["date"],
-            source_system=event_data["source"],
-            payload=event_data["payload"]
+    mappings = [
+        {
+            "entity_id": entities[event_data["entity"]],
+            "event_type": event_data["type"],
+            "event_date": event_data["date"],
+            "source_system": event_data["source"],
+            "payload": event_data["payload"]
+        }
+        for event_data in events_data
+    ]
+    if db.bind.dialect.name == "postgresql":
+        # Same raw COPY path as relationships; JSONB payloads go over the
+        # wire pre-serialized since COPY has no parameter binding.
+        event_columns = ["entity_id", "event_type", "event_date",
+                         "source_system", "payload"]
+        _copy_rows(
+            db, "events", event_columns,
+            [(m["entity_id"], m["event_type"], m["event_date"],
+              m["source_system"], json.dumps(m["payload"]))
+             for m in mappings]
         )
-        db.add(event)
+    else:
+        _insert_chunked(db, Event.__table__.insert(), mappings, batch_size)
     
-    db.commit()
     logger.info(f"Created {len(events_data)} events")
 
 
+def create_scaled_data(
+    db,
+    people: Dict[tuple, int],
+    addresses: Dict[str, int],
+    scale: int,
+    batch_size: int = 1000
+) -> None:
+    """Synthesize extra entities/properties/ownership rows for load testing.
+
+    --scale N adds (N - 1) * 10 synthetic entities and properties on top
+    of the curated sample set, drawn from a fixed-seed RNG so runs are
+    reproducible. Columns are drawn in one batch per column and fed
+    straight through the same Core insert / COPY paths as the curated
+    data, so the batching infrastructure gets exercised for real.
+    """
+    n = (scale - 1) * 10
+    if n <= 0:
+        return
+
+    logger.info(f"Generating {n} synthetic entities and properties (--scale {scale})...")
+    rng = random.Random(1337)
+
+    agent_ids = [pid for (role, _), pid in people.items() if role == "agent"]
+    address_ids = list(addresses.values())
+
+    types = rng.choices(["llc", "corp", "trust"], weights=[6, 3, 1], k=n)
+    ages = [rng.randint(45, 2500) for _ in range(n)]
+    sale_ages = [rng.randint(30, 1800) for _ in range(n)]
+    market_values = [round(rng.uniform(100_000, 2_000_000), 2) for _ in range(n)]
+    confidences = [round(rng.uniform(0.80, 1.00), 2) for _ in range(n)]
+
+    entity_mappings = [
+        {
+            "external_id": f"S{i:08d}",
+            "source_system": "synthetic",
+            "type": types[i],
+            "legal_name": f"Synthetic Holdings {i} {types[i].upper()}",
+            "jurisdiction": "FL",
+            "status": "ACTIVE",
+            "formation_date": _days_ago(ages[i]),
+            "ein_available": bool(i % 2),
+            "ein_verified": bool(i % 4 == 0),
+            "registered_agent_id": rng.choice(agent_ids),
+            "primary_address_id": rng.choice(address_ids)
+        }
+        for i in range(n)
+    ]
+    entity_rows = _insert_chunked(
+        db,
+        Entity.__table__.insert().returning(Entity.id, Entity.external_id),
+        entity_mappings,
+        batch_size
+    )
+    entity_ids_by_external = {row.external_id: row.id for row in entity_rows}
+
+    property_mappings = [
+        {
+            "parcel_id": f"SYN-{i:06d}-000",
+            "county": "Marion",
+            "jurisdiction": "FL",
+            "situs_address_id": rng.choice(address_ids),
+            "appraiser_url": None,
+            "land_use_code": rng.choice(["0100", "0200", "0400"]),
+            "acreage": Decimal(str(round(rng.uniform(0.1, 50.0), 2))),
+            "last_sale_date": _days_ago(sale_ages[i]),
+            "last_sale_price": Decimal(str(round(market_values[i] * 0.9, 2))),
+            "market_value": Decimal(str(market_values[i])),
+            "assessed_value": Decimal(str(round(market_values[i] * 0.93, 2))),
+            "homestead_exempt": "N",
+            "tax_year": "2024"
+        }
+        for i in range(n)
+    ]
+    property_rows = _insert_chunked(
+        db,
+        Property.__table__.insert().returning(Property.id, Property.parcel_id),
+        property_mappings,
+        batch_size
+    )
+    property_ids_by_parcel = {row.parcel_id: row.id for row in property_rows}
+
+    rel_rows = [
+        (
+            "entity", entity_ids_by_external[f"S{i:08d}"],
+            "property", property_ids_by_parcel[f"SYN-{i:06d}-000"],
+            "owns", "synthetic", _days_ago(sale_ages[i]), None,
+            Decimal(str(confidences[i]))
+        )
+        for i in range(n)
+    ]
+    if db.bind.dialect.name == "postgresql":
+        _copy_rows(
+            db, "relationships",
+            ["from_type", "from_id", "to_type", "to_id", "rel_type",
+             "source_system", "start_date", "end_date", "confidence"],
+            rel_rows
+        )
+    else:
+        _insert_chunked(db, Relationship.__table__.insert(), [
+            dict(zip(["from_type", "from_id", "to_type", "to_id", "rel_type",
+                      "source_system", "start_date", "end_date", "confidence"], row))
+            for row in rel_rows
+        ], batch_size)
+
+    logger.info(f"Created {n} synthetic entities, {n} properties, {n} ownership relationships")
+
+
 def verify_data(db) -> None:
     """Run verification queries to validate the data."""
     logger.info("\n" + "="*80)
     logger.info("DATA VERIFICATION")
     logger.info("="*80)
     
-    # Count records
+    # Count records: all seven counts in one round-trip via scalar
+    # subqueries rather than a query per table.
+    counts = db.execute(text(
+        "SELECT"
+        " (SELECT count(*) FROM entities) AS entities,"
+        " (SELECT count(*) FROM people) AS people,"
+        " (SELECT count(*) FROM addresses) AS addresses,"
+        " (SELECT count(*) FROM properties) AS properties,"
+        " (SELECT count(*) FROM relationships) AS relationships,"
+        " (SELECT count(*) FROM events) AS events,"
+        " (SELECT count(*) FROM risk_scores) AS risk_scores"
+    )).one()
     logger.info("\nRecord Counts:")
-    logger.info(f"  Entities: {db.query(Entity).count()}")
-    logger.info(f"  People: {db.query(Person).count()}")
-    logger.info(f"  Addresses: {db.query(Address).count()}")
-    logger.info(f"  Properties: {db.query(Property).count()}")
-    logger.info(f"  Relationships: {db.query(Relationship).count()}")
-    logger.info(f"  Events: {db.query(Event).count()}")
-    logger.info(f"  Risk Scores: {db.query(RiskScore).count()}")
+    logger.info(f"  Entities: {counts.entities}")
+    logger.info(f"  People: {counts.people}")
+    logger.info(f"  Addresses: {counts.addresses}")
+    logger.info(f"  Properties: {counts.properties}")
+    logger.info(f"  Relationships: {counts.relationships}")
+    logger.info(f"  Events: {counts.events}")
+    logger.info(f"  Risk Scores: {counts.risk_scores}")
     
     # Sample relationships
     logger.info("\nSample Relationships:")
@@ -735,9 +1098,8 @@ def verify_data(db) -> None:
     logger.info("\nHigh-Risk Patterns Identified:")
     
     # New entities (< 90 days)
-    today = date.today()
     new_entities = db.query(Entity).filter(
-        Entity.formation_date >= today - timedelta(days=90)
+        Entity.formation_date >= _days_ago(90)
     ).all()
     logger.info(f"  New Entities (< 90 days): {len(new_entities)}")
     for entity in new_entities:
@@ -806,17 +1168,19 @@ def verify_data(db) -> None:
     triple_crown = db.query(Entity).filter(Entity.legal_name == "Triple Crown Properties LLC").first()
     if triple_crown:
         logger.info(f"  Properties owned by {triple_crown.legal_name}:")
-        property_rels = db.query(Relationship).filter(
+        # One JOIN instead of a SELECT per owned property
+        owned_properties = db.query(Property).join(
+            Relationship,
+            Relationship.to_id == Property.id
+        ).filter(
             Relationship.from_type == 'entity',
             Relationship.from_id == triple_crown.id,
             Relationship.rel_type == 'owns',
             Relationship.to_type == 'property'
         ).all()
-        
-        for rel in property_rels:
-            prop = db.query(Property).filter(Property.id == rel.to_id).first()
-            if prop:
-                logger.info(f"    - Parcel {prop.parcel_id}: ${prop.market_value} market value")
+
+        for prop in owned_properties:
+            logger.info(f"    - Parcel {prop.parcel_id}: ${prop.market_value} market value")
     
     logger.info("\n" + "="*80)
     logger.info("VERIFICATION COMPLETE")
@@ -827,7 +1191,8 @@ def main():
     """Main execution function."""
     parser = argparse.ArgumentParser(description="Seed sample data for Chain Of Record")
     parser.add_argument('--clear-all', action='store_true', help='Delete all existing data before seeding')
-    parser.add_argument('--batch-size', type=int, default=100, help='Number of records to insert per batch')
+    parser.add_argument('--batch-size', type=int, default=10000, help='Rows per INSERT statement for bulk phases')
+    parser.add_argument('--scale', type=int, default=1, help='Multiply the dataset with synthetic rows (1 = curated data only)')
     args = parser.parse_args()
     
     logger.info("="*80)
@@ -841,17 +1206,36 @@ def main():
         if args.clear_all:
             clear_all_data(db)
         
-        # Create data
+        # Create data in one transaction: ids come back via RETURNING, so
+        # nothing flushes mid-phase and only the final COMMIT pays the
+        # WAL fsync. autoflush is off because the select-backs (parcel
+        # ids, pg_indexes) must not trigger speculative unit-of-work
+        # flushes.
         logger.info("\nCreating sample data...")
-        people = create_people(db)
-        addresses = create_addresses(db)
-        entities = create_entities(db, people, addresses)
-        properties = create_properties(db, addresses)
-        create_relationships(db, entities, people, addresses, properties)
-        create_events(db, entities)
+        with db.begin(), db.no_autoflush:
+            # Seed data is re-runnable; skip the fsync wait on COMMIT and
+            # give the sorts/index rebuilds room, for this transaction only.
+            if db.bind.dialect.name == "postgresql":
+                db.execute(text("SET LOCAL synchronous_commit = off"))
+                db.execute(text("SET LOCAL work_mem = '256MB'"))
+                db.execute(text("SET LOCAL maintenance_work_mem = '512MB'"))
+            people = create_people(db, args.batch_size)
+            addresses = create_addresses(db, args.batch_size)
+            entities = create_entities(db, people, addresses, args.batch_size)
+            properties = create_properties(db, addresses, args.batch_size)
+            create_relationships(db, entities, people, addresses, properties,
+                                 args.batch_size)
+            create_events(db, entities, args.batch_size)
+            create_scaled_data(db, people, addresses, args.scale, args.batch_size)
         
         logger.info("\nSample data creation complete!")
         
+        # Refresh planner statistics so the first queries against the
+        # freshly seeded tables don't run on empty-table estimates.
+        if db.bind.dialect.name == "postgresql":
+            db.execute(text("ANALYZE"))
+            db.commit()
+        
         # Verify data
         verify_data(db)
         
@@ -863,9 +1247,7 @@ def main():
         
     except Exception as e:
         db.rollback()
-        logger.error(f"\n❌ ERROR: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"\n❌ ERROR: {e}")
         sys.exit(1)
     finally:
         db.close()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+API verification script for Chain Of Record.
+
+Exercises the mounted API surface in-process through a TestClient, as a
+quick smoke check that the app imports, the routers are wired under the
+v1 prefix, and the OpenAPI schema builds. Complements scripts/test_api.sh,
+which runs the same checks over HTTP against a deployed instance.
+
+Requires a reachable database (the app lifespan initializes the schema
+in development mode).
+
+Usage:
+    python test_verification_api.py
+"""
+import sys
+
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.main import app
+
+# Memoize the OpenAPI schema once at import: generation walks every
+# route and response model, and FastAPI serves app.openapi_schema as-is
+# whenever it is already populated.
+app.openapi_schema = app.openapi()
+
+# Route paths resolved once at import; every check that asserts on the
+# mounted surface reads this frozenset instead of re-walking app.routes.
+_MOUNTED_PATHS = frozenset(
+    getattr(route, "path", "") for route in app.routes
+)
+
+
+def check_api_info(client):
+    """The app identifies itself."""
+    assert app.title == settings.app_name, app.title
+    assert app.version, "missing API version"
+
+
+def check_route_wiring(client):
+    """Every router is mounted under the v1 prefix.
+
+    Checks the import-time _MOUNTED_PATHS snapshot — no need to rebuild
+    and serialize the whole OpenAPI document just to enumerate paths.
+    """
+    assert _MOUNTED_PATHS, "no routes mounted"
+    for expected in ("/health", "/entities/", "/properties/", "/scores/"):
+        prefixed = settings.api_v1_prefix + expected
+        assert any(p.startswith(prefixed) for p in _MOUNTED_PATHS), f"missing {prefixed}"
+
+
+def check_openapi_schema(client):
+    """The (memoized) OpenAPI document is served."""
+    response = client.get("/openapi.json")
+    assert response.status_code == 200, response.text
+    assert response.json()["paths"], "no paths in OpenAPI schema"
+
+
+def check_health(client):
+    """Liveness endpoint answers."""
+    response = client.get(f"{settings.api_v1_prefix}/health")
+    assert response.status_code == 200, response.text
+
+
+def check_entities_list(client):
+    """Entity listing returns a JSON array."""
+    response = client.get(f"{settings.api_v1_prefix}/entities/")
+    assert response.status_code == 200, response.text
+    assert isinstance(response.json(), list), response.text
+
+
+CHECKS = [
+    check_api_info,
+    check_route_wiring,
+    check_openapi_schema,
+    check_health,
+    check_entities_list,
+]
+
+
+def main() -> int:
+    failed = 0
+    # One TestClient context for the whole run: the ASGI lifespan
+    # (logging setup, dev-mode init_db) starts and stops exactly once
+    # instead of per check.
+    with TestClient(app) as client:
+        for check in CHECKS:
+            try:
+                check(client)
+            except Exception as e:
+                print(f"✗ FAIL: {check.__name__}: {e}")
+                failed += 1
+            else:
+                print(f"✓ PASS: {check.__name__}")
+    print(f"\n{len(CHECKS) - failed}/{len(CHECKS)} checks passed")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,6 +5,7 @@
 -- Create extensions
 CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
 CREATE EXTENSION IF NOT EXISTS "pg_trgm";  -- For fuzzy text matching
+CREATE EXTENSION IF NOT EXISTS "pgcrypto";  -- For server-side address hashing (digest)
 
 -- Core tables (matching our SQLAlchemy models)
 
@@ -133,7 +134,7 @@ CREATE INDEX IF NOT EXISTS idx_properties_sale_date ON properties(last_sale_date
 CREATE INDEX IF NOT EXISTS idx_properties_sale_price ON properties(last_sale_price);
 
 -- Relationship indexes (critical for graph performance)
-CREATE INDEX IF NOT EXISTS idx_relationships_from ON relationships(from_type, from_id, rel_type);
+CREATE INDEX IF NOT EXISTS idx_relationships_from ON relationships(from_type, from_id, rel_type, to_type);
 CREATE INDEX IF NOT EXISTS idx_relationships_to ON relationships(to_type, to_id, rel_type);
 CREATE INDEX IF NOT EXISTS idx_relationships_active ON relationships(end_date) WHERE end_date IS NULL;
 CREATE INDEX IF NOT EXISTS idx_relationships_source ON relationships(source_system, rel_type);
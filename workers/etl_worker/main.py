@@ -1,7 +1,10 @@
 # ETL Worker main process
+import argparse
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import Optional
 
 # Add the backend directory to Python path
 backend_dir = Path(__file__).parent.parent.parent / "backend"
@@ -11,11 +14,19 @@ from sqlalchemy.orm import Session
 from app.core.db import SessionLocal
 from app.core.config import settings
 from app.core.logging import setup_logging, get_logger
-from app.ingest.base import IngestCoordinator
+from app.ingest.base import IngestCoordinator, get_http_client
 from app.ingest.sunbiz import SunbizSource
 from app.ingest.property_appraiser_fl_marion import MarionCountyPropertySource
 import time
 
+# Source instances are stateless between runs; build them once at import
+# so each scheduled ingest reuses them instead of re-constructing per run.
+# Both share one HTTP client, so pooled connections and TLS sessions
+# carry over between scheduled fetches.
+HTTP_CLIENT = get_http_client()
+SUNBIZ_SOURCE = SunbizSource(session=HTTP_CLIENT)
+MARION_SOURCE = MarionCountyPropertySource(session=HTTP_CLIENT)
+
 
 def setup_worker():
     """Initialize worker environment."""
@@ -29,44 +40,48 @@ def create_coordinator(db: Session) -> IngestCoordinator:
     """Create and configure the ingest coordinator."""
     coordinator = IngestCoordinator(db)
     
-    # Register data sources
-    coordinator.register_source(SunbizSource())
-    coordinator.register_source(MarionCountyPropertySource())
+    # Register the shared source instances
+    coordinator.register_source(SUNBIZ_SOURCE)
+    coordinator.register_source(MARION_SOURCE)
     
     return coordinator
 
 
-def run_full_ingest(logger):
-    """Run complete ingest process for all sources."""
-    db: Session = SessionLocal()
+def run_full_ingest(logger, batch_size: int = 1000):
+    """Run complete ingest process for all sources, in parallel."""
+    source_names = [SUNBIZ_SOURCE.name, MARION_SOURCE.name]
     
     try:
-        coordinator = create_coordinator(db)
-        
         logger.info("Starting full ingest process")
         start_time = time.time()
         
-        # Run all sources
-        results = coordinator.run_all_sources(batch_size=50, max_errors=5)
-        
-        # Log results
+        # The sources are I/O-bound (HTTP + DB), so the full ingest takes
+        # max(source time) instead of the sum when they run concurrently.
+        # Each worker opens its own session inside run_single_source —
+        # sessions are not thread-safe. Results are aggregated as each
+        # source finishes and dropped immediately, so per-row error
+        # lists never pile up across sources.
         total_processed = 0
         total_successful = 0
         total_failed = 0
         
-        for source_name, result in results.items():
-            logger.info(
-                f"Source {source_name}: {result.status.value} - "
-                f"{result.records_successful}/{result.records_processed} successful "
-                f"({result.success_rate:.1f}%) in {result.duration_seconds:.2f}s"
-            )
-            
-            total_processed += result.records_processed
-            total_successful += result.records_successful
-            total_failed += result.records_failed
-            
-            if result.errors:
-                logger.warning(f"Errors in {source_name}: {result.errors[:3]}")  # Show first 3 errors
+        with ThreadPoolExecutor(max_workers=len(source_names)) as executor:
+            futures = {
+                executor.submit(
+                    run_single_source, name, logger, batch_size=batch_size
+                ): name
+                for name in source_names
+            }
+            for future in as_completed(futures):
+                source_name = futures[future]
+                result = future.result()
+                
+                total_processed += result.records_processed
+                total_successful += result.records_successful
+                total_failed += result.records_failed
+                
+                if result.errors:
+                    logger.warning(f"Errors in {source_name}: {result.errors[:3]}")  # Show first 3 errors
         
         total_time = time.time() - start_time
         
@@ -75,18 +90,27 @@ def run_full_ingest(logger):
             f"({(total_successful/total_processed*100):.1f}%) in {total_time:.2f}s"
         )
         
-        return results
+        return {
+            "processed": total_processed,
+            "successful": total_successful,
+            "failed": total_failed,
+        }
         
     except Exception as e:
-        logger.error(f"Fatal error in ingest process: {e}")
+        logger.exception(f"Fatal error in ingest process: {e}")
         raise
-    finally:
-        db.close()
 
 
-def run_single_source(source_name: str, logger, **kwargs):
-    """Run ingest for a single source."""
-    db: Session = SessionLocal()
+def run_single_source(source_name: str, logger, db: Optional[Session] = None, **kwargs):
+    """Run ingest for a single source.
+
+    Accepts an existing session so callers composing several runs reuse
+    one pooled connection; a session is opened (and closed) here only
+    when none is passed.
+    """
+    owns_session = db is None
+    if owns_session:
+        db = SessionLocal()
     
     try:
         coordinator = create_coordinator(db)
@@ -107,30 +131,28 @@ def run_single_source(source_name: str, logger, **kwargs):
         return result
         
     finally:
-        db.close()
+        if owns_session:
+            db.close()
 
 
 def main():
     """Main worker entry point."""
     logger = setup_worker()
     
-    # Parse command line arguments
-    if len(sys.argv) > 1:
-        command = sys.argv[1]
-        
-        if command == "full":
-            run_full_ingest(logger)
-        elif command == "sunbiz":
-            run_single_source("sunbiz", logger)
-        elif command == "marion":
-            run_single_source("marion_pa", logger)
-        else:
-            logger.error(f"Unknown command: {command}")
-            print("Usage: python main.py [full|sunbiz|marion]")
-            sys.exit(1)
-    else:
-        # Default: run full ingest
-        run_full_ingest(logger)
+    parser = argparse.ArgumentParser(description="Chain Of Record ETL worker")
+    parser.add_argument('command', nargs='?', default='full',
+                        choices=['full', 'sunbiz', 'marion'],
+                        help='Which ingest to run (default: full)')
+    parser.add_argument('--batch-size', type=int, default=1000,
+                        help='Records fetched per source batch')
+    args = parser.parse_args()
+    
+    if args.command == "full":
+        run_full_ingest(logger, batch_size=args.batch_size)
+    elif args.command == "sunbiz":
+        run_single_source("sunbiz", logger, batch_size=args.batch_size)
+    elif args.command == "marion":
+        run_single_source("marion_pa", logger, batch_size=args.batch_size)
 
 
 if __name__ == "__main__":
@@ -2,6 +2,7 @@
 import schedule
 import time
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
@@ -22,26 +23,35 @@ class ETLScheduler:
     def __init__(self):
         setup_logging()
         self.logger = get_logger(__name__)
+        # Jobs run on this pool so a long full ingest cannot stall the
+        # other sources' slots behind it on the scheduler thread.
+        self.executor = ThreadPoolExecutor(
+            max_workers=3, thread_name_prefix="etl-job"
+        )
         self.setup_jobs()
     
     def setup_jobs(self):
         """Configure scheduled jobs."""
         
         # Full ingest daily at 2 AM
-        schedule.every().day.at("02:00").do(self.run_daily_full_ingest)
+        schedule.every().day.at("02:00").do(self.submit_job, self.run_daily_full_ingest)
         
         # Sunbiz updates every 4 hours during business hours
-        schedule.every(4).hours.do(self.run_sunbiz_update).tag("business_hours")
+        schedule.every(4).hours.do(self.submit_job, self.run_sunbiz_update).tag("business_hours")
         
         # Marion County updates twice daily
-        schedule.every().day.at("06:00").do(self.run_marion_update)
-        schedule.every().day.at("18:00").do(self.run_marion_update)
+        schedule.every().day.at("06:00").do(self.submit_job, self.run_marion_update)
+        schedule.every().day.at("18:00").do(self.submit_job, self.run_marion_update)
         
         self.logger.info("ETL jobs scheduled")
         self.logger.info("- Full ingest: Daily at 2:00 AM")
         self.logger.info("- Sunbiz updates: Every 4 hours")  
         self.logger.info("- Marion updates: 6:00 AM and 6:00 PM")
     
+    def submit_job(self, job_func):
+        """Dispatch a due job to the worker pool."""
+        self.executor.submit(job_func)
+    
     def run_daily_full_ingest(self):
         """Run the full daily ingest."""
         self.logger.info("Starting scheduled full ingest")
@@ -49,7 +59,7 @@ class ETLScheduler:
             run_full_ingest(self.logger)
             self.logger.info("Scheduled full ingest completed successfully")
         except Exception as e:
-            self.logger.error(f"Scheduled full ingest failed: {e}")
+            self.logger.exception(f"Scheduled full ingest failed: {e}")
     
     def run_sunbiz_update(self):
         """Run Sunbiz incremental update."""
@@ -61,7 +71,7 @@ class ETLScheduler:
                 run_single_source("sunbiz", self.logger, batch_size=100)
                 self.logger.info("Scheduled Sunbiz update completed")
             except Exception as e:
-                self.logger.error(f"Scheduled Sunbiz update failed: {e}")
+                self.logger.exception(f"Scheduled Sunbiz update failed: {e}")
         else:
             self.logger.debug("Skipping Sunbiz update (outside business hours)")
     
@@ -72,7 +82,7 @@ class ETLScheduler:
             run_single_source("marion_pa", self.logger, batch_size=200)
             self.logger.info("Scheduled Marion County update completed")
         except Exception as e:
-            self.logger.error(f"Scheduled Marion County update failed: {e}")
+            self.logger.exception(f"Scheduled Marion County update failed: {e}")
     
     def run_scheduler(self):
         """Run the scheduler loop."""
@@ -81,11 +91,20 @@ class ETLScheduler:
         try:
             while True:
                 schedule.run_pending()
-                time.sleep(60)  # Check every minute
+                # Sleep until the next job is due instead of polling on a
+                # fixed 60s tick; cap the nap so newly relevant schedules
+                # are still picked up within the hour.
+                idle = schedule.idle_seconds()
+                if idle is None:
+                    time.sleep(60)
+                elif idle > 0:
+                    time.sleep(min(idle, 3600))
         except KeyboardInterrupt:
             self.logger.info("ETL Scheduler stopped by user")
         except Exception as e:
-            self.logger.error(f"ETL Scheduler error: {e}")
+            self.logger.exception(f"ETL Scheduler error: {e}")
+        finally:
+            self.executor.shutdown(wait=True)
     
     def list_jobs(self):
         """List all scheduled jobs."""
@@ -93,7 +112,8 @@ class ETLScheduler:
         self.logger.info(f"Scheduled jobs ({len(jobs)} total):")
         
         for job in jobs:
-            self.logger.info(f"- {job.job_func.__name__}: {job.next_run}")
+            # job_func is submit_job; the real job is its bound argument
+            self.logger.info(f"- {job.job_func.args[0].__name__}: {job.next_run}")
     
     def run_job_now(self, job_name: str):
         """Run a specific job immediately."""